@@ -1,13 +1,33 @@
 import os
+import json
+import random
 import time
-from winotify import Notification
-import requests
+import socket
 import subprocess
+import stat
 import sys
-import yaml
-import tempfile
-from datetime import datetime, timezone
-import xml.etree.ElementTree as ET
+import functools
+import hashlib
+# winotify、yaml、xml.etree、tempfile、datetime 均在使用处延迟导入，
+# 以缩短开机自启动时的冷启动时间
+
+# 配置中视为“是”的取值（统一转为小写后比较）
+_TRUTHY: frozenset[str] = frozenset(("yes", "true", "1"))
+
+# 配置项键名（驻留字符串，字典查找走快速路径）
+_K_EXT_PATH = sys.intern("Use_excternal_path")
+_K_PATH = sys.intern("Path")
+_K_AUTO = sys.intern("lauch_when_device_start")
+_K_CHECK_INTERVAL = sys.intern("check_interval")
+_K_MAX_DELAY = sys.intern("max_delay")
+_K_MAX_CHECK_TIMES = sys.intern("max_check_times")
+_K_NOTIFICATION = sys.intern("use_notification")
+
+# 上次成功应用的自启动状态
+_STATE_FILE = os.path.join(os.path.expanduser("~"), ".time_checker_state.json")
+
+# 已解析配置的缓存：路径 -> (mtime, size, dict)
+_CFG_CACHE: dict[str, tuple[float, int, dict]] = {}
 
 def get_base_dir():
     # 打包后使用 sys.executable，开发运行时使用 __file__
@@ -15,6 +35,50 @@ def get_base_dir():
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.abspath(__file__))
 
+def _import_yaml():
+    """延迟导入 PyYAML，返回 (yaml, Loader, Dumper)"""
+    import yaml
+    try:
+        # libyaml 提供的 C 实现，解析速度远高于纯 Python 版本
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+def _json_cache_path(filename):
+    """config.yaml 旁的 JSON 缓存文件路径"""
+    return filename + ".cache.json"
+
+def _write_json_atomic(path, data):
+    """原子写入 JSON 文件（配置缓存、运行状态）；失败时静默忽略"""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except Exception:
+            pass
+
+def _write_default(filename, default):
+    """
+    原子写入默认配置（先写同目录 .tmp 再 os.replace），
+    避免进程中途被终止时留下截断的 config.yaml；失败时静默忽略。
+    """
+    tmp = filename + ".tmp"
+    try:
+        yaml, _, dumper = _import_yaml()
+        with open(tmp, "w", encoding="utf-8") as f:
+            yaml.dump(default, f, Dumper=dumper, allow_unicode=True, default_flow_style=False)
+        os.replace(tmp, filename)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except Exception:
+            pass
+
 def load_config(filename=None):
     """
     读取 YAML 配置并返回 dict。
@@ -30,37 +94,82 @@ def load_config(filename=None):
         "Path": "",
         "lauch_when_device_start": "No",
         "check_interval": 1000,
+        "max_delay": 30,
         "max_check_times": 3,
         "use_notification": "Yes"
     }
 
+    # 只 stat 一次：既判断文件是否存在，也供下方缓存校验复用
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-            if not isinstance(data, dict):
-                raise ValueError("config is not a mapping")
-            return data
+        st = os.stat(filename)
+    except (OSError, ValueError):
+        # 与 os.path.isfile 一致：不存在、父路径不是目录、无权限、路径含 NUL 等均视为文件不存在
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        _write_default(filename, default)
+        return default
+
+    cached = _CFG_CACHE.get(filename)
+    # 文件未变化（mtime 与 size 均一致）时直接返回缓存，调用方不会修改该 dict
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[2]
+    # JSON 缓存记录了生成时 YAML 的 (mtime_ns, size)，两者完全一致时直接读取，跳过 YAML 解析。
+    # 不能只比较新旧：复制文件会保留源文件的修改时间，新配置可能比缓存“更旧”
+    cache_file = _json_cache_path(filename)
+    data = None
+    try:
+        with open(cache_file, "rb") as f:
+            cache = json.load(f)
+        if (isinstance(cache, dict) and cache.get("mtime_ns") == st.st_mtime_ns
+                and cache.get("size") == st.st_size and isinstance(cache.get("data"), dict)):
+            data = cache["data"]
     except Exception:
-        # 文件不存在或解析失败：尝试写入默认配置并返回默认 dict
+        data = None
+    if data is None:
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                yaml.safe_dump(default, f, allow_unicode=True, default_flow_style=False)
+            yaml, loader, _ = _import_yaml()
+            with open(filename, "r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=loader) or {}
+            if not isinstance(data, dict):
+                raise ValueError("config is not a mapping")
         except Exception:
-            pass
-        return default
+            # 解析失败：尝试写入默认配置并返回默认 dict
+            _write_default(filename, default)
+            return default
+        _write_json_atomic(cache_file, {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data})
+    _CFG_CACHE[filename] = (st.st_mtime, st.st_size, data)
+    return data
 
 def get_config_var(cfg, part, default=None):
     """
     如果不存在返回 default
     """
-    if not cfg:
-        return default
-    if part not in cfg:
-        return default
-    return cfg[part]
+    return cfg.get(part, default) if cfg else default
 
+@functools.lru_cache(maxsize=1)
 def schtask_exists(task_name="TimeChecker"):
-    """检查计划任务是否已存在"""
+    """
+    检查计划任务是否已存在（同一次运行内缓存结果）。
+    优先通过 Task Scheduler COM 接口在进程内查询，无 pywin32 时回退到 schtasks /Query。
+    """
+    try:
+        import win32com.client
+        import pywintypes
+    except ImportError:
+        pass
+    else:
+        try:
+            scheduler = win32com.client.Dispatch("Schedule.Service")
+            scheduler.Connect()
+            root = scheduler.GetFolder("\\")
+        except Exception:
+            root = None
+        if root is not None:
+            try:
+                root.GetTask(task_name)
+                return True
+            except pywintypes.com_error:
+                return False
     try:
         res = subprocess.run(["schtasks", "/Query", "/TN", task_name],
                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -85,96 +194,127 @@ def get_current_user_sid():
     raise RuntimeError("Failed to get SID")
 
 
+# 计划任务 XML 模板：结构固定，仅少量字段需要插值（插值前须做 XML 转义）
+# 触发器仅使用 LogonTrigger（用户登录时触发），Delay 避免登录瞬间环境未就绪；
+# Principal 使用当前用户并要求以最高权限运行；
+# Settings 允许在电池上运行（DisallowStartIfOnBatteries=false），并尽量保守设置；
+# Actions 执行当前 Python 可执行文件（或直接执行脚本/可执行）
+_TASK_XML_TMPL = """<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <RegistrationInfo>
+    <Date>{date}</Date>
+    <Author>{author}</Author>
+  </RegistrationInfo>
+  <Triggers>
+    <LogonTrigger>
+      <Enabled>true</Enabled>
+      <Delay>PT10S</Delay>
+    </LogonTrigger>
+  </Triggers>
+  <Principals>
+    <Principal id="Author">
+      <UserId>{userid}</UserId>
+      <LogonType>InteractiveToken</LogonType>
+      <RunLevel>HighestAvailable</RunLevel>
+    </Principal>
+  </Principals>
+  <Settings>
+    <IdleSettings>
+      <Duration>PT10M</Duration>
+      <WaitTimeout>PT1H</WaitTimeout>
+      <StopOnIdleEnd>true</StopOnIdleEnd>
+      <RestartOnIdle>false</RestartOnIdle>
+    </IdleSettings>
+    <MultipleInstancesPolicy>IgnoreNew</MultipleInstancesPolicy>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <AllowHardTerminate>true</AllowHardTerminate>
+    <StartWhenAvailable>false</StartWhenAvailable>
+    <RunOnlyIfNetworkAvailable>false</RunOnlyIfNetworkAvailable>
+    <AllowStartOnDemand>true</AllowStartOnDemand>
+    <Enabled>true</Enabled>
+    <Hidden>false</Hidden>
+    <RunOnlyIfIdle>false</RunOnlyIfIdle>
+    <WakeToRun>false</WakeToRun>
+    <ExecutionTimeLimit>P3D</ExecutionTimeLimit>
+    <Priority>7</Priority>
+  </Settings>
+  <Actions Context="Author">
+    <Exec>
+      <Command>{command}</Command>{arguments}
+    </Exec>
+  </Actions>
+</Task>
+"""
+
 def _build_task_xml(task_name: str, command: str, arguments: str = "") -> bytes:
     """
     生成 Task XML（bytes，UTF-16 编码），UserId 使用当前用户，确保在电池上也能启动。
     返回 UTF-16 编码的 XML 内容。
     """
-    ns = "http://schemas.microsoft.com/windows/2004/02/mit/task"
-    ET.register_namespace("", ns)
-    T = lambda tag: f"{{{ns}}}{tag}"
-
-    task = ET.Element(T("Task"), {"version": "1.2"})
-    reg = ET.SubElement(task, T("RegistrationInfo"))
-    ET.SubElement(reg, T("Date")).text = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
-    ET.SubElement(reg, T("Author")).text = os.environ.get("USERNAME", "Unknown")
-
-    # 触发器：仅使用 LogonTrigger（用户登录时触发），删除其他触发器
-    triggers = ET.SubElement(task, T("Triggers"))
-    logon = ET.SubElement(triggers, T("LogonTrigger"))
-    ET.SubElement(logon, T("Enabled")).text = "true"
-    # 可选延迟，避免登录瞬间环境未就绪
-    ET.SubElement(logon, T("Delay")).text = "PT10S"
-
-    # Principal 使用当前用户
-    principals = ET.SubElement(task, T("Principals"))
-    principal = ET.SubElement(principals, T("Principal"), {"id": "Author"})
+    from datetime import datetime, timezone
+    from xml.sax.saxutils import escape
+
     '''
     domain = os.environ.get("USERDOMAIN", "")
     user = os.environ.get("USERNAME", "")
     userid = f"{domain}\\{user}" if domain else user'''
     userid = get_current_user_sid()
     print("Current User SID:", userid)
-    ET.SubElement(principal, T("UserId")).text = userid
-    ET.SubElement(principal, T("LogonType")).text = "InteractiveToken"
-    # 要求以最高权限运行
-    ET.SubElement(principal, T("RunLevel")).text = "HighestAvailable"
-
-    # Settings: 允许在电池上运行（DisallowStartIfOnBatteries=false），并尽量保守设置
-    settings = ET.SubElement(task, T("Settings"))
-    idle = ET.SubElement(settings, T("IdleSettings"))
-    ET.SubElement(idle, T("Duration")).text = "PT10M"
-    ET.SubElement(idle, T("WaitTimeout")).text = "PT1H"
-    ET.SubElement(idle, T("StopOnIdleEnd")).text = "true"
-    ET.SubElement(idle, T("RestartOnIdle")).text = "false"
-
-    ET.SubElement(settings, T("MultipleInstancesPolicy")).text = "IgnoreNew"
-    ET.SubElement(settings, T("DisallowStartIfOnBatteries")).text = "false"
-    ET.SubElement(settings, T("StopIfGoingOnBatteries")).text = "false"
-    ET.SubElement(settings, T("AllowHardTerminate")).text = "true"
-    ET.SubElement(settings, T("StartWhenAvailable")).text = "false"
-    ET.SubElement(settings, T("RunOnlyIfNetworkAvailable")).text = "false"
-    ET.SubElement(settings, T("AllowStartOnDemand")).text = "true"
-    ET.SubElement(settings, T("Enabled")).text = "true"
-    ET.SubElement(settings, T("Hidden")).text = "false"
-    ET.SubElement(settings, T("RunOnlyIfIdle")).text = "false"
-    ET.SubElement(settings, T("WakeToRun")).text = "false"
-    ET.SubElement(settings, T("ExecutionTimeLimit")).text = "P3D"
-    ET.SubElement(settings, T("Priority")).text = "7"
-
-    # Actions：执行当前 Python 可执行文件（或直接执行脚本/可执行）
-    actions = ET.SubElement(task, T("Actions"), {"Context": "Author"})
-    exec_el = ET.SubElement(actions, T("Exec"))
-    ET.SubElement(exec_el, T("Command")).text = command
-    if arguments:
-        ET.SubElement(exec_el, T("Arguments")).text = arguments
-
-    tree = ET.ElementTree(task)
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml", mode="wb") as tf:
-        tree.write(tf, encoding="utf-16", xml_declaration=True)
-        tf.flush()
-        tfpath = tf.name
+    args_el = f"\n      <Arguments>{escape(arguments)}</Arguments>" if arguments else ""
+    return _TASK_XML_TMPL.format(
+        date=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        author=escape(os.environ.get("USERNAME", "Unknown")),
+        userid=escape(userid),
+        command=escape(command),
+        arguments=args_el,
+    ).encode("utf-16")
+
+def _task_command():
+    """返回计划任务要执行的 (command, arguments)"""
+    # 使用当前 Python 可执行作为命令；如果你想运行脚本可替换为脚本路径并传参
+    command = os.path.abspath(sys.executable)
+    # 如果是直接运行脚本，可将 arguments 设置为脚本路径：
+    script_path = os.path.join(get_base_dir(), os.path.basename(sys.argv[0]))
+    arguments = f'"{script_path}"' if os.path.exists(script_path) else ""
+    return command, arguments
+
+def _task_hash(task_name, command, arguments):
+    """
+    计划任务内容的指纹。XML 中含注册时间，每次生成都不同，
+    因此对决定任务内容的输入（任务名、命令、参数）求哈希。
+    """
+    key = "\0".join((task_name, command, arguments)).encode("utf-8")
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+def _load_state():
+    """读取上次成功应用的自启动状态 {"autostart": bool, "task_xml_hash": str}"""
     try:
-        with open(tfpath, "rb") as f:
-            content = f.read()
-    finally:
-        try:
-            os.unlink(tfpath)
-        except Exception:
-            pass
-    return content
+        with open(_STATE_FILE, "rb") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except Exception:
+        return {}
+
+def _save_state(autostart, task_xml_hash=""):
+    _write_json_atomic(_STATE_FILE, {"autostart": autostart, "task_xml_hash": task_xml_hash})
+
+def autostart_up_to_date(auto, task_name="TimeChecker"):
+    """自启动状态与上次成功应用时一致则返回 True，此时无需再查询/修改计划任务"""
+    state = _load_state()
+    if state.get("autostart") is not auto:
+        return False
+    return not auto or state.get("task_xml_hash") == _task_hash(task_name, *_task_command())
 
 def create_schtask(task_name="TimeChecker"):
     """
     使用动态生成的 XML 创建计划任务（保证 UserId 与路径匹配，并允许在电池上运行）。
     如果生成 XML 或创建失败，则回退到 /SC ONLOGON /TR 方式。
     """
+    import tempfile
+
     try:
-        # 使用当前 Python 可执行作为命令；如果你想运行脚本可替换为脚本路径并传参
-        command = os.path.abspath(sys.executable)
-        # 如果是直接运行脚本，可将 arguments 设置为脚本路径：
-        script_path = os.path.join(get_base_dir(), os.path.basename(sys.argv[0]))
-        arguments = f'"{script_path}"' if os.path.exists(script_path) else ""
+        command, arguments = _task_command()
         xml_bytes = _build_task_xml(task_name, command, arguments)
 
         # 写临时 XML 文件并用 schtasks /Create /XML 创建
@@ -197,7 +337,8 @@ def create_schtask(task_name="TimeChecker"):
             exe = os.path.abspath(sys.executable)
             cmd = ["schtasks", "/Create", "/SC", "ONLOGON", "/TN", task_name,
                    "/TR", f'"{exe}"', "/RL", "HIGHEST", "/F"]
-            subprocess.run(" ".join(cmd), check=True, shell=True)
+            # 列表形式直接执行 schtasks，不经过 cmd.exe；带引号的路径作为单个参数传入
+            subprocess.run(cmd, check=True, shell=False)
             return True, f"Created by /TR fallback (xml error: {e})"
         except Exception as e2:
             return False, f"both methods failed: {e} / {e2}"
@@ -215,27 +356,87 @@ def delete_schtask(task_name="TimeChecker"):
         return False, str(e)
 
 def ensure_schtask_installed(task_name="TimeChecker"):
-    """如果不存在则创建计划任务（返回 (ok, msg)）。"""
-    if schtask_exists(task_name):
+    """
+    如果不存在则创建计划任务（返回 (ok, msg)）。
+    任务已存在但指纹与上次记录的不一致（如可执行文件路径变化）时重新创建。
+    """
+    digest = _task_hash(task_name, *_task_command())
+    if schtask_exists(task_name) and _load_state().get("task_xml_hash") == digest:
         return True, "exists"
-    return create_schtask(task_name)
+    ok, msg = create_schtask(task_name)
+    if ok:
+        schtask_exists.cache_clear()
+        _save_state(True, digest)
+    return ok, msg
 
 def ensure_schtask_removed(task_name="TimeChecker"):
     """如果存在则删除计划任务（返回 (ok, msg)）。"""
     if not schtask_exists(task_name):
+        _save_state(False)
         return True, "not found"
-    return delete_schtask(task_name)
+    ok, msg = delete_schtask(task_name)
+    if ok:
+        schtask_exists.cache_clear()
+        _save_state(False)
+    return ok, msg
+
+def ensure_w32time_running(service="w32time"):
+    """
+    确保 w32time 服务处于运行状态。
+    优先通过 pywin32 在进程内查询/启动服务（不再反复调用 sc.exe），无 pywin32 时回退到 sc 命令。
+    """
+    try:
+        import pywintypes
+        import win32service
+        import win32serviceutil
+    except ImportError:
+        q = subprocess.run(["sc", "query", service], capture_output=True, text=True)
+        out = (q.stdout or "") + (q.stderr or "")
+        if "RUNNING" not in out:
+            subprocess.run(["sc", "start", service], capture_output=True, text=True)
+            # 等待短暂确认
+            for _ in range(5):
+                time.sleep(1)
+                q = subprocess.run(["sc", "query", service], capture_output=True, text=True)
+                if "RUNNING" in (q.stdout or ""):
+                    break
+        return
+
+    def current_state():
+        # QueryServiceStatus 返回 SERVICE_STATUS 元组，下标 1 为当前状态；查询失败返回 None
+        try:
+            return win32serviceutil.QueryServiceStatus(service)[1]
+        except pywintypes.error:
+            return None
+
+    state = current_state()
+    if state == win32service.SERVICE_RUNNING:
+        return
+    # 仅在已停止时启动：START_PENDING 等状态下 StartService 会报错（1056）。
+    # 与 sc start 一样忽略启动失败（如拒绝访问），仍继续等待并执行 w32tm /resync
+    if state == win32service.SERVICE_STOPPED:
+        try:
+            win32serviceutil.StartService(service)
+        except pywintypes.error:
+            pass
+    # 等待短暂确认（最多约 5 秒）
+    for _ in range(25):
+        time.sleep(0.2)
+        if current_state() == win32service.SERVICE_RUNNING:
+            break
 
 def is_connected():
+    # 仅做 TCP 连通性探测，无需引入 requests（其导入开销远大于一次连接）
     try:
-        requests.get("https://www.baidu.com", timeout=5)
+        socket.create_connection(("www.baidu.com", 443), timeout=5).close()
         return True
-    except requests.RequestException:
+    except OSError:
         return False
 
-def send_notification(title, message):
-    enble = get_config_var(load_config(), "use_notification", "Yes")
-    if str(enble).lower() in ("yes", "true", "1"):
+def send_notification(title, message, enabled: bool):
+    """enabled 由 main 根据配置计算一次后传入，避免每次通知都重新读取配置"""
+    if enabled:
+        from winotify import Notification
         toast = Notification(app_id="Time Checker",
                             title=title,
                             msg=message,
@@ -246,57 +447,66 @@ def send_notification(title, message):
 
 def main():
     config = load_config()
-    # 自启动设置（仅使用 schtasks，不再生成 startup bat）
-    auto = get_config_var(config, "lauch_when_device_start", "No")
-    if str(auto).lower() in ("yes", "true", "1"):
-        ok, msg = ensure_schtask_installed()
-        if not ok:
-            send_notification("Autostart Failed", f"Failed to create scheduled task: {msg}")
+    # 布尔型配置只在此处归一化一次
+    notif_enabled = str(get_config_var(config, _K_NOTIFICATION, "Yes")).lower() in _TRUTHY
+    auto = str(get_config_var(config, _K_AUTO, "No")).lower() in _TRUTHY
+    use_ext_path = str(get_config_var(config, _K_EXT_PATH, "No")).lower() in _TRUTHY
+    # 自启动设置（仅使用 schtasks，不再生成 startup bat）；
+    # 与上次成功应用的状态一致时跳过，稳定状态下不再调用 schtasks
+    if autostart_up_to_date(auto):
+        connected = is_connected()
     else:
-        ok, msg = ensure_schtask_removed()
-        if not ok:
-            send_notification("Autostart Cleanup Failed", f"Failed to remove scheduled task: {msg}")
+        # 首次联网检测与计划任务设置互不依赖，放到后台线程并行执行；
+        # 计划任务设置留在主线程（COM 调用需要在已初始化的线程中进行）
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            fut_net = ex.submit(is_connected)
+            if auto:
+                ok, msg = ensure_schtask_installed()
+                if not ok:
+                    send_notification("Autostart Failed", f"Failed to create scheduled task: {msg}", notif_enabled)
+            else:
+                ok, msg = ensure_schtask_removed()
+                if not ok:
+                    send_notification("Autostart Cleanup Failed", f"Failed to remove scheduled task: {msg}", notif_enabled)
+            connected = fut_net.result()
 
-    max_check_times = int(get_config_var(config, "max_check_times", 3))
-    check_interval = int(get_config_var(config, "check_interval", 1000))
+    max_check_times = int(get_config_var(config, _K_MAX_CHECK_TIMES, 3))
+    check_interval = int(get_config_var(config, _K_CHECK_INTERVAL, 1000))
+    max_delay = float(get_config_var(config, _K_MAX_DELAY, 30))
     for i in range(max_check_times):
-        if is_connected():
+        if i > 0:
+            connected = is_connected()
+        if connected:
             try:
-                if get_config_var(config, "Use_excternal_path", "No").lower() in ("yes", "true", "1"):
-                    path = get_config_var(config, "Path", "")
+                if use_ext_path:
+                    path = get_config_var(config, _K_PATH, "")
                     if not path:
-                        send_notification("Failure", "No valid path configured for time update executable.")
+                        send_notification("Failure", "No valid path configured for time update executable.", notif_enabled)
                         return
                     os.startfile(path)
-                    send_notification("Success", "The time has been checked successfully.")
+                    send_notification("Success", "The time has been checked successfully.", notif_enabled)
                 else:
                     # 简化：尝试启动 w32time 服务（若尚未运行），然后执行 w32tm /resync
                     try:
-                        q = subprocess.run(["sc", "query", "w32time"], capture_output=True, text=True)
-                        out = (q.stdout or "") + (q.stderr or "")
-                        if "RUNNING" not in out:
-                            subprocess.run(["sc", "start", "w32time"], capture_output=True, text=True)
-                            # 等待短暂确认
-                            for _ in range(5):
-                                time.sleep(1)
-                                q = subprocess.run(["sc", "query", "w32time"], capture_output=True, text=True)
-                                if "RUNNING" in (q.stdout or ""):
-                                    break
+                        ensure_w32time_running()
                         proc = subprocess.run(["w32tm", "/resync"], capture_output=True, text=True)
                         if proc.returncode != 0:
                             raise RuntimeError(f"w32tm failed: {proc.returncode} {proc.stdout} {proc.stderr}")
-                        send_notification("Success", "The time has been checked successfully.")
+                        send_notification("Success", "The time has been checked successfully.", notif_enabled)
                     except Exception as e:
-                        send_notification("Failure", f"w32tm failed or service not running: {e}")
+                        send_notification("Failure", f"w32tm failed or service not running: {e}", notif_enabled)
             except Exception as e:
-                send_notification("Failure", f"Failed to launch Time checker: {e}")
+                send_notification("Failure", f"Failed to launch Time checker: {e}", notif_enabled)
             break
         else:
             if i < max_check_times - 1:
-                send_notification("Failure", f"Network connection failed. Remain attempts: {max_check_times - i - 1}")
-                time.sleep(check_interval)
+                send_notification("Failure", f"Network connection failed. Remain attempts: {max_check_times - i - 1}", notif_enabled)
+                # 指数退避 + 随机抖动：check_interval（毫秒）为基础间隔，加上抖动后仍不超过 max_delay 秒
+                delay = check_interval / 1000.0 * (2 ** i) * (1 + random.uniform(0, 0.5))
+                time.sleep(min(max_delay, delay))
             else:
-                send_notification("Failure", "Time check failed.")
+                send_notification("Failure", "Time check failed.", notif_enabled)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file